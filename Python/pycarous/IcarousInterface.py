@@ -1,6 +1,6 @@
 import abc
+import math
 import sys
-import numpy as np
 
 from ichelper import (LoadIcarousParams,
                       ReadFlightplanFile,
@@ -36,8 +36,10 @@ class IcarousInterface(abc.ABC):
         self.windFrom = 0
         self.windSpeed = 0
 
-        self.transmitter = None
-        self.receiver = None
+        self._transmitter = None
+        self._receiver = None
+        self._canTransmit = False
+        self._canReceive = False
 
         # Aircraft data
         self.apps         = []
@@ -117,6 +119,43 @@ class IcarousInterface(abc.ABC):
         """
         pass
 
+    @property
+    def transmitter(self):
+        return self._transmitter
+
+    @transmitter.setter
+    def transmitter(self, transmitter):
+        self._transmitter = transmitter
+        self._UpdateCommFlags()
+
+    @property
+    def receiver(self):
+        return self._receiver
+
+    @receiver.setter
+    def receiver(self, receiver):
+        self._receiver = receiver
+        self._UpdateCommFlags()
+
+    @property
+    def apps(self):
+        return self._apps
+
+    @apps.setter
+    def apps(self, apps):
+        # Stored as a tuple so it can only change by assignment,
+        # which keeps the cached comm flags up to date
+        self._apps = tuple(apps)
+        self._UpdateCommFlags()
+
+    def _UpdateCommFlags(self):
+        """
+        Cache whether V2V transmit/receive is possible so the per-step
+        TransmitPosition and ReceiveV2VData calls don't recheck it
+        """
+        self._canTransmit = self._transmitter is not None and "SBN" not in self._apps
+        self._canReceive = self._receiver is not None
+
     def InputWind(self, windFrom, windSpeed):
         """
         Set the current wind vector for vehicle simulation
@@ -130,9 +169,7 @@ class IcarousInterface(abc.ABC):
         """
         Receive any V2V messages available to receiver model and input to ICAROUS
         """
-        if self.receiver is None:
-            return
-        if not self.missionStarted or self.missionComplete:
+        if not self._canReceive or not self.missionStarted or self.missionComplete:
             return
         received_msgs = self.receiver.receive(self.currTime, self.position)
         for msg in received_msgs:
@@ -247,12 +284,8 @@ class IcarousInterface(abc.ABC):
         self.localFences = []
         self.localMergeFixes = []
         for plan in self.plans:
-            wps = [[wp.latitude,wp.longitude,wp.altitude] for wp in plan]
-            times = [wp.time for wp in plan]
-            tcps = [[*wp.tcp] for wp in plan]
-            tcpValues = [[*wp.tcpValue] for wp in plan]
-            localwps = list(map(to_local,wps))
-            localFP = [[val[0],*val[1],*val[2],*val[3]] for val in zip(times,localwps,tcps,tcpValues)]
+            localFP = [[wp.time,*to_local([wp.latitude,wp.longitude,wp.altitude]),*wp.tcp,*wp.tcpValue]
+                       for wp in plan]
             self.localPlans.append(localFP)
         for fence in self.fences:
             localFence = list(map(to_local, fence))
@@ -273,26 +306,26 @@ class IcarousInterface(abc.ABC):
         return local
 
     def RecordOwnship(self):
-        if self.ownshipLog["time"]:
-            last_time = self.ownshipLog["time"][-1]
-        else:
-            last_time = -1
+        log = self.ownshipLog
+        times = log["time"]
+        last_time = times[-1] if times else -1
         if self.currTime - last_time < self.minLogInterval:
             return
-        if sum(abs(p) for p in self.position) < 1e-3:
+        pos = self.position
+        if abs(pos[0]) + abs(pos[1]) + abs(pos[2]) < 1e-3:
             return
 
-        self.ownshipLog["time"].append(self.currTime)
-        self.ownshipLog["position"].append(self.position)
-        self.ownshipLog["velocityNED"].append(self.velocity)
-        self.ownshipLog["positionNED"].append(self.localPos)
-        self.ownshipLog["commandedVelocityNED"].append(self.controlInput)
-        self.ownshipLog["planOffsets"].append(self.planoffsets)
+        times.append(self.currTime)
+        log["position"].append(pos)
+        log["velocityNED"].append(self.velocity)
+        log["positionNED"].append(self.localPos)
+        log["commandedVelocityNED"].append(self.controlInput)
+        log["planOffsets"].append(self.planoffsets)
 
-        record_bands(self.ownshipLog["trkbands"], self.trkband)
-        record_bands(self.ownshipLog["gsbands"], self.gsband)
-        record_bands(self.ownshipLog["altbands"], self.altband)
-        record_bands(self.ownshipLog["vsbands"], self.vsband)
+        record_bands(log["trkbands"], self.trkband)
+        record_bands(log["gsbands"], self.gsband)
+        record_bands(log["altbands"], self.altband)
+        record_bands(log["vsbands"], self.vsband)
 
     def RecordTraffic(self, callsign, position, velocity, localPos):
         if callsign not in self.trafficLog.keys():
@@ -313,11 +346,7 @@ class IcarousInterface(abc.ABC):
     def TransmitPosition(self):
         """ Transmit current position """
         # Do not broadcast if running SBN
-        if "SBN" in self.apps:
-            return
-        if self.transmitter is None:
-            return
-        if not self.missionStarted or self.missionComplete:
+        if not self._canTransmit or not self.missionStarted or self.missionComplete:
             return
         msg_data = {
             "callsign": self.callsign,
@@ -405,9 +434,21 @@ class IcarousInterface(abc.ABC):
                     "parameters": self.params,
                     "sim_type": self.simType}
 
-        import json
-        with open(logname, 'w') as f:
-            json.dump(log_data, f)
+        # orjson writes NaN/inf as null, unlike json (NaN/Infinity). Only use
+        # its output when it has no nulls so the log is the same either way.
+        try:
+            import orjson
+            output = orjson.dumps(log_data, option=orjson.OPT_SERIALIZE_NUMPY |
+                                                   orjson.OPT_NON_STR_KEYS)
+            if b"null" in output:
+                output = None
+        except (ImportError, TypeError):
+            output = None
+        if output is None:
+            import json
+            output = json.dumps(log_data).encode()
+        with open(logname, 'wb') as f:
+            f.write(output)
 
 
 def BandsLog():
@@ -423,15 +464,16 @@ def BandsLog():
 
 
 def record_bands(log, bands):
-    filterinfnan = lambda x: "nan" if np.isnan(x)  else "inf" if np.isinf(x) else x
+    filterinfnan = lambda x: "nan" if math.isnan(x) else "inf" if math.isinf(x) else x
     if bands is not None:
+        n = bands['numBands']
         log["conflict"].append(bands['currentConflictBand'])
         log["resUp"].append(filterinfnan(bands['resUp']))
-        log["resDown"].append(filterinfnan(bands['resDown'])) 
-        log["numBands"].append(bands['numBands'])
-        log["bandTypes"].append([bands['type'][i] for i in range(bands['numBands'])])
-        log["low"].append([bands['min'][i] for i in range(bands['numBands'])])
-        log["high"].append([bands['max'][i] for i in range(bands['numBands'])])
+        log["resDown"].append(filterinfnan(bands['resDown']))
+        log["numBands"].append(n)
+        log["bandTypes"].append(bands['type'][:n])
+        log["low"].append(bands['min'][:n])
+        log["high"].append(bands['max'][:n])
     else:
         log["conflict"].append(0)
         log["resUp"].append("nan")
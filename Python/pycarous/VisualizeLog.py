@@ -3,6 +3,8 @@
 import json
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 from Icarous import VisualizeSimData
 from ichelper import GetPlanPositions,GetEUTLPlanFromFile
@@ -17,6 +19,89 @@ class playback():
         self.daa_radius = []
         self.params = {}
 
+# Top level log entries needed for playback
+LOG_KEYS = ('state','traffic','flightplans','origin','flightplans_local',
+            'geofences_local','parameters','mergefixes_local')
+
+# Approximate number of samples used for a non-exact bounding box
+BBOX_SAMPLES = 4096
+
+def LoadLog(filename):
+    """
+    Parse the entries of a json log file that are needed for playback,
+    using orjson when it is available
+    :param filename: path to the json log file
+    """
+    with open(filename,'rb') as fp:
+        raw = fp.read()
+    try:
+        import orjson
+        data = orjson.loads(raw)
+    except:
+        data = json.loads(raw)
+    return {key: data[key] for key in LOG_KEYS}
+
+def GetBounds(points,xcol,ycol,exact=True):
+    """
+    Compute the bounding box of a list of points
+    :param points: list of points (N x M)
+    :param xcol: column index of the x coordinate
+    :param ycol: column index of the y coordinate
+    :param exact: when False, only use about BBOX_SAMPLES evenly strided points
+    :return: xmin, xmax, ymin, ymax
+    """
+    points = np.asarray(points)
+    stride = 1 if exact else max(1,points.shape[0]//BBOX_SAMPLES)
+    x = points[::stride,xcol]
+    y = points[::stride,ycol]
+    return float(x.min()),float(x.max()),float(y.min()),float(y.max())
+
+def LoadPlayback(filename,fast_bbox=False):
+    """
+    Load a json log file into a playback object
+    :param filename: path to the json log file
+    :param fast_bbox: estimate the ownship bounds from about BBOX_SAMPLES
+                      strided positions instead of every logged position
+    :return: (playback, bounds) where bounds is (xmin, xmax, ymin, ymax)
+             of the ownship path and mission plan, or None if the file
+             could not be loaded
+    """
+    try:
+        data = LoadLog(filename)
+        pb = playback()
+        pb.ownshipLog = data['state']
+        pb.trafficLog = data['traffic']
+        pb.plans = data['flightplans']
+        pb.home_pos = data['origin']
+        pb.localPlans = data['flightplans_local']
+        pb.localFences = [fence["vertices"] for fence in data['geofences_local']]
+        pb.params = data['parameters']
+        pb.daa_radius = pb.params['DET_1_WCV_DTHR']*0.3048
+        pb.localMergeFixes = data['mergefixes_local']
+    except:
+        return None
+    # Convert the trajectories once here instead of on every animation frame.
+    # Entries that don't form a regular N x 3 array are kept as lists.
+    for agent, log in [('ownship',pb.ownshipLog),*pb.trafficLog.items()]:
+        for key in ['positionNED','velocityNED']:
+            if key not in log:
+                continue
+            try:
+                log[key] = np.asarray(log[key],dtype=np.float32)
+            except (ValueError,TypeError):
+                print("%s: keeping %s %s as a list" % (filename,agent,key))
+    try:
+        _xmin,_xmax,_ymin,_ymax = GetBounds(pb.ownshipLog['positionNED'],1,0,not fast_bbox)
+        _xminfp,_xmaxfp,_yminfp,_ymaxfp = GetBounds(pb.localPlans[0],2,1)
+        _xmin = min(_xmin,_xminfp)
+        _xmax = max(_xmax,_xmaxfp)
+        _ymin = min(_ymin,_yminfp)
+        _ymax = max(_ymax,_ymaxfp)
+        bounds = (_xmin,_xmax,_ymin,_ymax)
+    except:
+        bounds = None
+    return pb, bounds
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Visualize Icarous log")
@@ -28,15 +113,14 @@ if __name__ == "__main__":
     parser.add_argument("--pad",type=float, default=25.0, help="extend the min/max values of the axes by the padding (in meters), default = 25.0 [m]")
     parser.add_argument("--speed",type=int, default=1.0, help="increase playback speed by given factor")
     parser.add_argument("--routes",default='',help="routes file")
+    parser.add_argument("--fast-bbox", action="store_true", help="estimate the axis limits from a strided sample of the logged positions (may clip the path)")
     args = parser.parse_args()
 
-    files = []
     pbs   = []
     if os.path.isfile(args.logfile):
-        files.append(args.logfile)
+        files = [args.logfile]
     else:
-        path =  args.logfile.rstrip('/')+'/*.json'
-        files = glob.glob(path)
+        files = glob.glob(os.path.join(args.logfile,'*.json'))
 
     xmin, ymin = 1e10, 1e10
     xmax, ymax = -1e10, -1e10 
@@ -49,43 +133,34 @@ if __name__ == "__main__":
             index = index + 1
             wps,n = GetEUTLPlanFromFile(args.routes,index)
             if n > 0:
-                locplan = [[wps[i].time,wps[i].latitude,wps[i].longitude,wps[i].altitude] for i in range(n)]
+                locplan = np.empty((n,4))
+                for i in range(n):
+                    wp = wps[i]
+                    locplan[i] = (wp.time,wp.latitude,wp.longitude,wp.altitude)
                 routes.append(locplan)
 
-    for file in files:
-        try:
-            fp = open(file,'r')
-            data = json.load(fp)
-            valid = True
-            pb = playback()
-            pb.ownshipLog = data['state']
-            pb.trafficLog = data['traffic']
-            pb.plans = data['flightplans']
-            pb.home_pos = data['origin']
-            pb.localPlans = data['flightplans_local']
-            pb.localFences = [fence["vertices"] for fence in data['geofences_local']]
-            pb.params = data['parameters']
-            pb.daa_radius = pb.params['DET_1_WCV_DTHR']*0.3048
-            pb.localMergeFixes = data['mergefixes_local']
-            pbs.append(pb)
-            _xmin = np.min(np.array(pb.ownshipLog['positionNED'])[:,1])
-            _xmax = np.max(np.array(pb.ownshipLog['positionNED'])[:,1])
-            _ymin = np.min(np.array(pb.ownshipLog['positionNED'])[:,0])
-            _ymax = np.max(np.array(pb.ownshipLog['positionNED'])[:,0])
-            _xminfp = np.min(np.array(pb.localPlans[0])[:,2])
-            _xmaxfp = np.max(np.array(pb.localPlans[0])[:,2])
-            _yminfp = np.min(np.array(pb.localPlans[0])[:,1])
-            _ymaxfp = np.max(np.array(pb.localPlans[0])[:,1])
-            _xmin = np.min([_xmin,_xminfp])
-            _xmax = np.max([_xmax,_xmaxfp])
-            _ymin = np.min([_ymin,_yminfp])
-            _ymax = np.max([_ymax,_ymaxfp])
-            xmin = np.min([xmin,_xmin])
-            ymin = np.min([ymin,_ymin])
-            xmax = np.max([xmax,_xmax])
-            ymax = np.max([ymax,_ymax])
-        except:
+    load = partial(LoadPlayback,fast_bbox=args.fast_bbox)
+    if len(files) > 1:
+        # Parse multiple logs in parallel, one worker per file at most
+        workers = min(len(files),os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(load, files))
+    else:
+        results = [load(file) for file in files]
+
+    for result in results:
+        if result is None:
+            continue
+        pb, bounds = result
+        valid = True
+        pbs.append(pb)
+        if bounds is None:
             continue
+        _xmin,_xmax,_ymin,_ymax = bounds
+        xmin = min(xmin,_xmin)
+        ymin = min(ymin,_ymin)
+        xmax = max(xmax,_xmax)
+        ymax = max(ymax,_ymax)
 
     if valid:
          if (xmax-xmin) > (ymax-ymin):